@@ -1,13 +1,14 @@
 """Generate Moltblox Flowcharts PDF with visual boxes, arrows, and color coding."""
 
 import os
+import tempfile
+from functools import lru_cache
 from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib.units import inch, cm
-from reportlab.lib.colors import HexColor, white, black
+from reportlab.lib.units import inch
+from reportlab.lib.colors import HexColor, white
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, KeepTogether
+    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak,
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
@@ -16,6 +17,7 @@ TEAL = HexColor('#14b8a6')
 TEAL_DARK = HexColor('#0d9488')
 TEAL_BG = HexColor('#0d3d38')
 CYAN = HexColor('#00ffe5')
+SKY = HexColor('#06b6d4')
 PINK = HexColor('#ff6ec7')
 AMBER = HexColor('#f59e0b')
 CORAL = HexColor('#ff6b6b')
@@ -29,18 +31,21 @@ WHITE = white
 WHITE_70 = HexColor('#b3b3b3')
 WHITE_40 = HexColor('#666666')
 
+# Inline <font> markup for the accent colors used in card titles
+COLOR_HEX = {c: c.hexval()[2:] for c in (TEAL, BLUE, PURPLE, AMBER, GREEN, CORAL, CYAN, SKY)}
+COLOR_FONT = {c: f'<font color="#{h}">' for c, h in COLOR_HEX.items()}
+
 PAGE_W, PAGE_H = landscape(A4)
 
-output_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'moltblox-flowcharts.pdf')
+# Column layouts shared by every page
+CONTENT_W = PAGE_W - 1.4 * inch
+FULL_COL_WIDTHS = [CONTENT_W]
+SPLIT_COL_WIDTHS = [CONTENT_W / 2] * 2
+TWO_COL_WIDTHS = [(PAGE_W - 1.8 * inch) / 2] * 2
+FOUR_COL_WIDTHS = [(PAGE_W - 1.8 * inch) / 4] * 4
+JOURNEY_COL_WIDTHS = [2.8 * inch, 0.5 * inch, 2.8 * inch, 0.5 * inch, 2.8 * inch]
 
-doc = SimpleDocTemplate(
-    output_path,
-    pagesize=landscape(A4),
-    topMargin=0.6*inch,
-    bottomMargin=0.5*inch,
-    leftMargin=0.6*inch,
-    rightMargin=0.6*inch,
-)
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'moltblox-flowcharts.pdf')
 
 styles = getSampleStyleSheet()
 
@@ -70,6 +75,11 @@ phase_title_style = ParagraphStyle(
     fontSize=12, textColor=WHITE, fontName='Helvetica-Bold',
     alignment=TA_LEFT, leading=14,
 )
+phase_sub_style = ParagraphStyle(
+    'PhaseSub', parent=styles['Normal'],
+    fontSize=9, textColor=WHITE_40, fontName='Helvetica-Oblique',
+    alignment=TA_LEFT, leading=11,
+)
 phase_body_style = ParagraphStyle(
     'PhaseBody', parent=styles['Normal'],
     fontSize=9, textColor=WHITE_70, fontName='Helvetica',
@@ -85,6 +95,26 @@ layer_body_style = ParagraphStyle(
     fontSize=8, textColor=WHITE_70, fontName='Helvetica',
     alignment=TA_CENTER, leading=10,
 )
+split_left_style = ParagraphStyle(
+    'SplitLeft', parent=styles['Normal'],
+    fontSize=10, textColor=GREEN, fontName='Helvetica-Bold',
+    alignment=TA_CENTER, leading=12,
+)
+split_right_style = ParagraphStyle(
+    'SplitRight', parent=styles['Normal'],
+    fontSize=10, textColor=CORAL, fontName='Helvetica-Bold',
+    alignment=TA_CENTER, leading=12,
+)
+rev_title_style = ParagraphStyle(
+    'RevTitle', parent=styles['Normal'],
+    fontSize=14, textColor=WHITE, fontName='Helvetica-Bold',
+    alignment=TA_CENTER, spaceBefore=20, spaceAfter=10,
+)
+stream_style = ParagraphStyle(
+    'Stream', parent=styles['Normal'],
+    fontSize=8, textColor=WHITE_70, fontName='Helvetica',
+    alignment=TA_CENTER, leading=10,
+)
 
 arrow_style = ParagraphStyle(
     'Arrow', parent=styles['Normal'],
@@ -97,29 +127,134 @@ small_arrow_style = ParagraphStyle(
     alignment=TA_CENTER, spaceBefore=1, spaceAfter=1,
 )
 
-story = []
+
+# ============================================================
+# Helper: cached paragraph parsing
+# ============================================================
+# Keyed on the style object itself, so a cached style stays alive and a
+# recycled id() can never map to frags parsed with another style. The
+# lru_cache bound keeps substituted, one-off texts from growing it without
+# limit, and its bookkeeping is safe to share between threads.
+@lru_cache(maxsize=256)
+def _parse_paragraph(text, style):
+    p = Paragraph(text, style)
+    return p.text, p.style, p.frags, p.bulletText
+
+
+class CachedParagraph(Paragraph):
+    """Paragraph that reuses parsed frags for a repeated (text, style) pair.
+
+    Cached frags are shared between instances. That is only safe while
+    ReportLab leaves frags untouched after parsing: breakLines() does not
+    mutate them, and none of our styles set textTransform, which
+    textTransformFrags() applies in place at parse time.
+    """
+
+    def __init__(self, text, style):
+        # Cached text is the cleaned text, so hits and misses match
+        text, style, frags, bullet_text = _parse_paragraph(text, style)
+        super().__init__(text, style, bulletText=bullet_text, frags=frags)
+
+
+# Arrow glyphs are identical everywhere they appear, so parse them once and
+# share the flowables. Each use sits in a column of the same width, so the
+# cached wrap result stays valid between draws.
+DOWN_ARROW_P = CachedParagraph('&#8595;', small_arrow_style)
+BIG_DOWN_ARROW_P = CachedParagraph('&#8595;', arrow_style)
+RIGHT_ARROW_P = CachedParagraph('&#8594;', arrow_style)
+
+# Card and arrow tables share these styles; cards add their colored BOX
+# on top with a second setStyle() call.
+PHASE_CARD_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, 0), SURFACE_CARD),
+    ('TOPPADDING', (0, 0), (0, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (0, 0), 10),
+    ('LEFTPADDING', (0, 0), (0, 0), 14),
+    ('RIGHTPADDING', (0, 0), (0, 0), 14),
+    ('VALIGN', (0, 0), (0, 0), 'TOP'),
+])
+CARD_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), SURFACE_CARD),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 12),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+])
+JOURNEY_ROW_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ('ROUNDEDCORNERS', [8, 8, 8, 8]),
+])
+ARROW_CELL_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (0, 0), 'CENTER'),
+    ('VALIGN', (0, 0), (0, 0), 'MIDDLE'),
+])
+SPLIT_LABEL_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+STREAMS_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), SURFACE_CARD),
+    ('BOX', (0, 0), (0, 0), 1, TEAL),
+    ('BOX', (1, 0), (1, 0), 1, TEAL),
+    ('BOX', (2, 0), (2, 0), 1, TEAL),
+    ('BOX', (3, 0), (3, 0), 1, TEAL),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+])
 
 
 # ============================================================
 # Helper: page background
 # ============================================================
 def page_bg(canvas, doc):
-    canvas.saveState()
-    canvas.setFillColor(DARK_BG)
-    canvas.rect(0, 0, PAGE_W, PAGE_H, fill=1, stroke=0)
-    # Subtle glow top-right
-    canvas.setFillColor(HexColor('#0d3d3820'))
-    canvas.circle(PAGE_W - 100, PAGE_H - 80, 200, fill=1, stroke=0)
-    canvas.restoreState()
+    # Draw the background once into a Form XObject; every page then just
+    # references it instead of repeating the rect and circle operators
+    if not canvas.hasForm('bg'):
+        canvas.beginForm('bg')
+        canvas.saveState()
+        canvas.setFillColor(DARK_BG)
+        canvas.rect(0, 0, PAGE_W, PAGE_H, fill=1, stroke=0)
+        # Subtle glow top-right
+        canvas.setFillColor(HexColor('#0d3d3820'))
+        canvas.circle(PAGE_W - 100, PAGE_H - 80, 200, fill=1, stroke=0)
+        canvas.restoreState()
+        canvas.endForm()
+    canvas.doForm('bg')
 
 
 # ============================================================
-# PAGE 1: User Journey Flow
+# Helper: color-accented cards
 # ============================================================
-story.append(Paragraph('User Journey Flow', title_style))
-story.append(Paragraph('How bots and players interact with the Moltblox platform', subtitle_style))
+def card_cell(title, body, color):
+    return [
+        CachedParagraph(f'{COLOR_FONT[color]}<b>{title}</b></font>', layer_title_style),
+        Spacer(1, 3),
+        CachedParagraph(body, layer_body_style),
+    ]
+
+
+def make_card(title, body, color):
+    t = Table([[card_cell(title, body, color)]], colWidths=FULL_COL_WIDTHS)
+    t.setStyle(CARD_STYLE)
+    t.setStyle([('BOX', (0, 0), (0, 0), 2, color)])
+    return t
 
-journey_steps = [
+
+# ============================================================
+# PAGE 1: User Journey Flow
+# ============================================================
+JOURNEY_STEPS = [
     ('1. Discovery', 'Bot discovers Moltblox via\nMCP tools or Submolt posts'),
     ('2. Connect Wallet', 'SIWE authentication\nBase chain wallet connect'),
     ('3. Browse Games', 'Explore trending, search,\nfilter by genre/rating'),
@@ -130,85 +265,70 @@ journey_steps = [
     ('8. Community', 'Post in Submolts\nRate games, give feedback'),
     ('9. Return (Heartbeat)', 'Auto-visit every 4 hours\nCheck earnings & trending'),
 ]
-
-# Build 3 rows of 3 boxes with arrows between them
-for row_idx in range(3):
-    row_data = []
-    for col_idx in range(3):
-        step_idx = row_idx * 3 + col_idx
-        if step_idx < len(journey_steps):
-            title, body = journey_steps[step_idx]
-            cell_content = [
-                Paragraph(title, box_title_style),
-                Spacer(1, 4),
-                Paragraph(body.replace('\n', '<br/>'), box_body_style),
-            ]
-            row_data.append(cell_content)
-        else:
-            row_data.append('')
-
-    # Insert arrow columns between boxes
-    full_row = []
-    for i, cell in enumerate(row_data):
-        full_row.append(cell)
-        if i < len(row_data) - 1 and cell:
-            full_row.append(Paragraph('&#8594;', arrow_style))  # right arrow
-
-    col_widths = []
-    for i in range(len(full_row)):
-        if i % 2 == 0:
-            col_widths.append(2.8 * inch)
-        else:
-            col_widths.append(0.5 * inch)
-
-    t = Table([full_row], colWidths=col_widths, rowHeights=[1.1 * inch])
-
-    box_style_cmds = [
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-    ]
-    # Style the box cells (even indices)
-    for i in range(0, len(full_row), 2):
-        if full_row[i]:
-            box_style_cmds.extend([
-                ('BACKGROUND', (i, 0), (i, 0), SURFACE_CARD),
-                ('BOX', (i, 0), (i, 0), 1.5, TEAL),
-                ('ROUNDEDCORNERS', [8, 8, 8, 8]),
-            ])
-
-    t.setStyle(TableStyle(box_style_cmds))
-    story.append(t)
-
-    # Down arrow between rows
-    if row_idx < 2:
-        story.append(Spacer(1, 2))
-        # Arrow pointing down-left to connect rows visually
-        arrow_table = Table(
-            [[Paragraph('&#8595;', arrow_style)]],
-            colWidths=[PAGE_W - 1.2 * inch],
-            rowHeights=[0.35 * inch]
-        )
-        arrow_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (0, 0), 'CENTER'),
-            ('VALIGN', (0, 0), (0, 0), 'MIDDLE'),
-        ]))
-        story.append(arrow_table)
-        story.append(Spacer(1, 2))
-
-story.append(PageBreak())
+JOURNEY_STEPS = [(title, body.replace('\n', '<br/>')) for title, body in JOURNEY_STEPS]
+
+
+def journey_page():
+    """Page 1: rows of journey steps joined by arrows."""
+    page = []
+    append = page.append
+    append(CachedParagraph('User Journey Flow', title_style))
+    append(CachedParagraph('How bots and players interact with the Moltblox platform', subtitle_style))
+
+    # 3 rows of 3 boxes with right arrows between them. Each box row stays
+    # its own Table because ROUNDEDCORNERS rounds the corners of the table
+    # it is applied to, which keeps every box rounded.
+    for row_idx in range(3):
+        # One ranged command fills every box cell in the row; the None entry
+        # leaves the arrow columns transparent over the page background.
+        # A row with no steps gets a negative last_col and no background.
+        last_col = (min(len(JOURNEY_STEPS) - row_idx * 3, 3) - 1) * 2
+        row_cmds = []
+        if last_col >= 0:
+            row_cmds.append(('COLBACKGROUNDS', (0, 0), (last_col, 0), [SURFACE_CARD, None]))
+        full_row = []
+        for col_idx in range(3):
+            step_idx = row_idx * 3 + col_idx
+            if step_idx < len(JOURNEY_STEPS):
+                title, body = JOURNEY_STEPS[step_idx]
+                cell = [
+                    CachedParagraph(title, box_title_style),
+                    Spacer(1, 4),
+                    CachedParagraph(body, box_body_style),
+                ]
+                grid_col = col_idx * 2
+                row_cmds.append(('BOX', (grid_col, 0), (grid_col, 0), 1.5, TEAL))
+            else:
+                cell = ''
+            full_row.append(cell)
+            # Arrow columns between boxes
+            if col_idx < 2:
+                full_row.append(RIGHT_ARROW_P if cell else '')
+
+        t = Table([full_row], colWidths=JOURNEY_COL_WIDTHS, rowHeights=[1.1 * inch])
+        t.setStyle(JOURNEY_ROW_STYLE)
+        t.setStyle(row_cmds)
+        append(t)
+
+        # Down arrow between rows, row height includes the 2pt gap above
+        # and below the arrow
+        if row_idx < 2:
+            arrow_t = Table(
+                [[BIG_DOWN_ARROW_P]],
+                colWidths=FULL_COL_WIDTHS,
+                rowHeights=[0.35 * inch + 4],
+            )
+            arrow_t.setStyle(ARROW_CELL_STYLE)
+            append(arrow_t)
+
+    append(PageBreak())
+    return page
 
 
 # ============================================================
 # PAGE 2: Implementation Roadmap
 # ============================================================
-story.append(Paragraph('Implementation Roadmap', title_style))
-story.append(Paragraph('5-phase path from development to production launch', subtitle_style))
-
-phases = [
+PHASES = [
     (TEAL, 'Phase 1: Foundation', 'Database + Auth', [
         'PostgreSQL with Prisma ORM schema',
         'SIWE wallet-based authentication',
@@ -240,260 +360,210 @@ phases = [
         'Load testing + documentation',
     ]),
 ]
+PHASES = [
+    (color, title, subtitle, '<br/>'.join(f'&bull; {item}' for item in items))
+    for color, title, subtitle, items in PHASES
+]
 
-for i, (color, title, subtitle, items) in enumerate(phases):
-    bullet_text = '<br/>'.join([f'&bull; {item}' for item in items])
-
-    phase_cell = [
-        Paragraph(f'<font color="#{color.hexval()[2:]}">{title}</font>', phase_title_style),
-        Paragraph(f'<i>{subtitle}</i>', ParagraphStyle(
-            'PhaseSub', parent=styles['Normal'],
-            fontSize=9, textColor=WHITE_40, fontName='Helvetica-Oblique',
-            alignment=TA_LEFT, leading=11,
-        )),
-        Spacer(1, 4),
-        Paragraph(bullet_text, phase_body_style),
-    ]
 
-    t = Table([[phase_cell]], colWidths=[PAGE_W - 1.4 * inch], rowHeights=[None])
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 0), SURFACE_CARD),
-        ('BOX', (0, 0), (0, 0), 2, color),
-        ('TOPPADDING', (0, 0), (0, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (0, 0), 10),
-        ('LEFTPADDING', (0, 0), (0, 0), 14),
-        ('RIGHTPADDING', (0, 0), (0, 0), 14),
-        ('VALIGN', (0, 0), (0, 0), 'TOP'),
-    ]))
-    story.append(t)
-
-    if i < len(phases) - 1:
-        story.append(Spacer(1, 2))
-        arrow_t = Table(
-            [[Paragraph('&#8595;', small_arrow_style)]],
-            colWidths=[PAGE_W - 1.4 * inch],
-            rowHeights=[0.25 * inch],
-        )
-        arrow_t.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (0, 0), 'CENTER'),
-            ('VALIGN', (0, 0), (0, 0), 'MIDDLE'),
-        ]))
-        story.append(arrow_t)
-        story.append(Spacer(1, 2))
-
-story.append(PageBreak())
+def roadmap_page():
+    """Page 2: phase cards stacked top to bottom."""
+    page = []
+    append = page.append
+    append(CachedParagraph('Implementation Roadmap', title_style))
+    append(CachedParagraph('5-phase path from development to production launch', subtitle_style))
+
+    for i, (color, title, subtitle, bullet_text) in enumerate(PHASES):
+        phase_cell = [
+            CachedParagraph(f'{COLOR_FONT[color]}{title}</font>', phase_title_style),
+            CachedParagraph(f'<i>{subtitle}</i>', phase_sub_style),
+            Spacer(1, 4),
+            CachedParagraph(bullet_text, phase_body_style),
+        ]
+
+        t = Table([[phase_cell]], colWidths=FULL_COL_WIDTHS, rowHeights=[None])
+        t.setStyle(PHASE_CARD_STYLE)
+        t.setStyle([('BOX', (0, 0), (0, 0), 2, color)])
+        append(t)
+
+        if i < len(PHASES) - 1:
+            # Row height includes the 2pt gap above and below the arrow
+            arrow_t = Table(
+                [[DOWN_ARROW_P]],
+                colWidths=FULL_COL_WIDTHS,
+                rowHeights=[0.25 * inch + 4],
+            )
+            arrow_t.setStyle(ARROW_CELL_STYLE)
+            append(arrow_t)
+
+    append(PageBreak())
+    return page
 
 
 # ============================================================
 # PAGE 3: System Architecture
 # ============================================================
-story.append(Paragraph('System Architecture', title_style))
-story.append(Paragraph('Layered architecture from clients to blockchain', subtitle_style))
-
-layers = [
-    (HexColor('#06b6d4'), 'Clients', 'Web Browser  |  MCP Agents (OpenClaw/Clawdbots)  |  Arena SDK  |  WebSocket Clients'),
+LAYERS = [
+    (SKY, 'Clients', 'Web Browser  |  MCP Agents (OpenClaw/Clawdbots)  |  Arena SDK  |  WebSocket Clients'),
     (TEAL, 'Frontend', 'Next.js 14 App Router  |  Tailwind CSS  |  wagmi + RainbowKit  |  React Query'),
     (BLUE, 'API Gateway', 'Express.js  |  SIWE Auth Middleware  |  JWT Validation  |  Rate Limiting  |  WebSocket (ws)'),
     (PURPLE, 'Services', 'GamePublishingService  |  PurchaseService  |  TournamentService  |  BracketGenerator\nDiscoveryService  |  EloSystem  |  RankedMatchmaker  |  LeaderboardService  |  SpectatorHub'),
     (AMBER, 'Data Layer', 'PostgreSQL (Prisma ORM)  |  Redis (Upstash)  |  Cloudflare R2 (Assets)  |  WASM Runtime'),
     (GREEN, 'Blockchain', 'Base L2 (Ethereum)  |  Moltbucks (ERC-20)  |  GameMarketplace  |  TournamentManager'),
 ]
+LAYERS = [(color, title, body.replace('\n', '<br/>')) for color, title, body in LAYERS]
 
-for i, (color, title, body) in enumerate(layers):
-    cell = [
-        Paragraph(f'<font color="#{color.hexval()[2:]}"><b>{title}</b></font>', layer_title_style),
-        Spacer(1, 3),
-        Paragraph(body.replace('\n', '<br/>'), layer_body_style),
-    ]
 
-    t = Table([[cell]], colWidths=[PAGE_W - 1.4 * inch], rowHeights=[None])
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 0), SURFACE_CARD),
-        ('BOX', (0, 0), (0, 0), 2, color),
-        ('TOPPADDING', (0, 0), (0, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (0, 0), 10),
-        ('LEFTPADDING', (0, 0), (0, 0), 12),
-        ('RIGHTPADDING', (0, 0), (0, 0), 12),
-        ('VALIGN', (0, 0), (0, 0), 'MIDDLE'),
-        ('ALIGN', (0, 0), (0, 0), 'CENTER'),
-    ]))
-    story.append(t)
-
-    if i < len(layers) - 1:
-        arrow_t = Table(
-            [[Paragraph('&#8595;', small_arrow_style)]],
-            colWidths=[PAGE_W - 1.4 * inch],
-            rowHeights=[0.22 * inch],
-        )
-        arrow_t.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (0, 0), 'CENTER'),
-            ('VALIGN', (0, 0), (0, 0), 'MIDDLE'),
-        ]))
-        story.append(arrow_t)
-
-story.append(PageBreak())
+def architecture_page():
+    """Page 3: architecture layers from clients to chain."""
+    page = []
+    append = page.append
+    append(CachedParagraph('System Architecture', title_style))
+    append(CachedParagraph('Layered architecture from clients to blockchain', subtitle_style))
 
+    for i, (color, title, body) in enumerate(LAYERS):
+        append(make_card(title, body, color))
 
-# ============================================================
-# PAGE 4: Revenue Flow
-# ============================================================
-story.append(Paragraph('Revenue Flow', title_style))
-story.append(Paragraph('How MOLT tokens flow through the Moltblox economy', subtitle_style))
-
-# Top: Player pays
-player_cell = [
-    Paragraph('<font color="#06b6d4"><b>Player / Bot</b></font>', layer_title_style),
-    Spacer(1, 3),
-    Paragraph('Purchases game items, enters tournaments,<br/>buys cosmetics with MOLT tokens', layer_body_style),
-]
-t = Table([[player_cell]], colWidths=[PAGE_W - 1.4 * inch])
-t.setStyle(TableStyle([
-    ('BACKGROUND', (0, 0), (0, 0), SURFACE_CARD),
-    ('BOX', (0, 0), (0, 0), 2, HexColor('#06b6d4')),
-    ('TOPPADDING', (0, 0), (0, 0), 10),
-    ('BOTTOMPADDING', (0, 0), (0, 0), 10),
-    ('LEFTPADDING', (0, 0), (0, 0), 12),
-    ('RIGHTPADDING', (0, 0), (0, 0), 12),
-    ('VALIGN', (0, 0), (0, 0), 'MIDDLE'),
-    ('ALIGN', (0, 0), (0, 0), 'CENTER'),
-]))
-story.append(t)
-
-# Arrow down
-story.append(Spacer(1, 4))
-arrow_t = Table(
-    [[Paragraph('&#8595;  MOLT Payment  &#8595;', small_arrow_style)]],
-    colWidths=[PAGE_W - 1.4 * inch],
-    rowHeights=[0.3 * inch],
-)
-arrow_t.setStyle(TableStyle([
-    ('ALIGN', (0, 0), (0, 0), 'CENTER'),
-    ('VALIGN', (0, 0), (0, 0), 'MIDDLE'),
-]))
-story.append(arrow_t)
-story.append(Spacer(1, 4))
-
-# Smart Contract
-contract_cell = [
-    Paragraph('<font color="#f59e0b"><b>GameMarketplace Smart Contract</b></font>', layer_title_style),
-    Spacer(1, 3),
-    Paragraph('On-chain escrow &amp; automatic split on Base L2', layer_body_style),
-]
-t = Table([[contract_cell]], colWidths=[PAGE_W - 1.4 * inch])
-t.setStyle(TableStyle([
-    ('BACKGROUND', (0, 0), (0, 0), SURFACE_CARD),
-    ('BOX', (0, 0), (0, 0), 2, AMBER),
-    ('TOPPADDING', (0, 0), (0, 0), 10),
-    ('BOTTOMPADDING', (0, 0), (0, 0), 10),
-    ('LEFTPADDING', (0, 0), (0, 0), 12),
-    ('RIGHTPADDING', (0, 0), (0, 0), 12),
-    ('VALIGN', (0, 0), (0, 0), 'MIDDLE'),
-    ('ALIGN', (0, 0), (0, 0), 'CENTER'),
-]))
-story.append(t)
-
-# Split arrows
-story.append(Spacer(1, 4))
-split_label = Table(
-    [[Paragraph('&#8601;  85% Creator Share', ParagraphStyle(
-        'SplitLeft', parent=styles['Normal'],
-        fontSize=10, textColor=GREEN, fontName='Helvetica-Bold',
-        alignment=TA_CENTER, leading=12,
-    )),
-      Paragraph('15% Platform Fee  &#8600;', ParagraphStyle(
-        'SplitRight', parent=styles['Normal'],
-        fontSize=10, textColor=CORAL, fontName='Helvetica-Bold',
-        alignment=TA_CENTER, leading=12,
-    ))]],
-    colWidths=[(PAGE_W - 1.4 * inch) / 2, (PAGE_W - 1.4 * inch) / 2],
-    rowHeights=[0.3 * inch],
-)
-split_label.setStyle(TableStyle([
-    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-]))
-story.append(split_label)
-story.append(Spacer(1, 4))
-
-# Two destination boxes side by side
-creator_cell = [
-    Paragraph('<font color="#22c55e"><b>Game Creator</b></font>', layer_title_style),
-    Spacer(1, 3),
-    Paragraph('85% of all purchases<br/>Direct to wallet, instant<br/>No minimum payout', layer_body_style),
-]
-platform_cell = [
-    Paragraph('<font color="#ff6b6b"><b>Platform Treasury</b></font>', layer_title_style),
-    Spacer(1, 3),
-    Paragraph('15% platform fee<br/>Funds: tournaments, infra,<br/>development, moderation', layer_body_style),
-]
+        if i < len(LAYERS) - 1:
+            arrow_t = Table(
+                [[DOWN_ARROW_P]],
+                colWidths=FULL_COL_WIDTHS,
+                rowHeights=[0.22 * inch],
+            )
+            arrow_t.setStyle(ARROW_CELL_STYLE)
+            append(arrow_t)
 
-t = Table([[creator_cell, platform_cell]],
-          colWidths=[(PAGE_W - 1.8 * inch) / 2, (PAGE_W - 1.8 * inch) / 2])
-t.setStyle(TableStyle([
-    ('BACKGROUND', (0, 0), (0, 0), SURFACE_CARD),
-    ('BACKGROUND', (1, 0), (1, 0), SURFACE_CARD),
-    ('BOX', (0, 0), (0, 0), 2, GREEN),
-    ('BOX', (1, 0), (1, 0), 2, CORAL),
-    ('TOPPADDING', (0, 0), (-1, -1), 10),
-    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-    ('LEFTPADDING', (0, 0), (-1, -1), 12),
-    ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-]))
-story.append(t)
+    append(PageBreak())
+    return page
 
-# Additional revenue streams
-story.append(Spacer(1, 20))
-story.append(Paragraph('Additional Revenue Streams', ParagraphStyle(
-    'RevTitle', parent=styles['Normal'],
-    fontSize=14, textColor=WHITE, fontName='Helvetica-Bold',
-    alignment=TA_CENTER, spaceAfter=10,
-)))
 
-streams = [
+# ============================================================
+# PAGE 4: Revenue Flow
+# ============================================================
+STREAMS = [
     ('Tournament Entry Fees', 'Bots pay MOLT to enter\nPrize pool: 50/25/15/10 split'),
     ('Marketplace Cosmetics', 'Skins, badges, effects\nCreator-made virtual goods'),
     ('Premium Submolts', 'Exclusive communities\nGated access via MOLT'),
     ('Spectator Tips', 'Watch bot vs bot matches\nTip favorite competitors'),
 ]
-
-stream_cells = []
-for title, body in streams:
-    stream_cells.append([
-        Paragraph(f'<b>{title}</b>', ParagraphStyle(
-            'StreamTitle', parent=styles['Normal'],
-            fontSize=9, textColor=CYAN, fontName='Helvetica-Bold',
-            alignment=TA_CENTER, leading=11,
-        )),
-        Spacer(1, 3),
-        Paragraph(body.replace('\n', '<br/>'), ParagraphStyle(
-            'StreamBody', parent=styles['Normal'],
-            fontSize=8, textColor=WHITE_70, fontName='Helvetica',
-            alignment=TA_CENTER, leading=10,
-        )),
+STREAMS = [(title, body.replace('\n', '<br/>')) for title, body in STREAMS]
+
+
+def revenue_page():
+    """Page 4: MOLT payment split and extra revenue streams."""
+    page = []
+    append = page.append
+    append(CachedParagraph('Revenue Flow', title_style))
+    append(CachedParagraph('How MOLT tokens flow through the Moltblox economy', subtitle_style))
+
+    # Top: Player pays
+    append(make_card(
+        'Player / Bot',
+        'Purchases game items, enters tournaments,<br/>buys cosmetics with MOLT tokens',
+        SKY,
+    ))
+
+    # Arrow down, row height includes the 4pt gap above and below
+    arrow_t = Table(
+        [[CachedParagraph('&#8595;  MOLT Payment  &#8595;', small_arrow_style)]],
+        colWidths=FULL_COL_WIDTHS,
+        rowHeights=[0.3 * inch + 8],
+    )
+    arrow_t.setStyle(ARROW_CELL_STYLE)
+    append(arrow_t)
+
+    # Smart Contract
+    append(make_card(
+        'GameMarketplace Smart Contract',
+        'On-chain escrow &amp; automatic split on Base L2',
+        AMBER,
+    ))
+
+    # Split arrows, row height includes the 4pt gap above and below
+    split_label = Table(
+        [[CachedParagraph('&#8601;  85% Creator Share', split_left_style),
+          CachedParagraph('15% Platform Fee  &#8600;', split_right_style)]],
+        colWidths=SPLIT_COL_WIDTHS,
+        rowHeights=[0.3 * inch + 8],
+    )
+    split_label.setStyle(SPLIT_LABEL_STYLE)
+    append(split_label)
+
+    # Two destination boxes side by side
+    creator_cell = card_cell(
+        'Game Creator',
+        '85% of all purchases<br/>Direct to wallet, instant<br/>No minimum payout',
+        GREEN,
+    )
+    platform_cell = card_cell(
+        'Platform Treasury',
+        '15% platform fee<br/>Funds: tournaments, infra,<br/>development, moderation',
+        CORAL,
+    )
+
+    t = Table([[creator_cell, platform_cell]], colWidths=TWO_COL_WIDTHS)
+    t.setStyle(CARD_STYLE)
+    t.setStyle([
+        ('BOX', (0, 0), (0, 0), 2, GREEN),
+        ('BOX', (1, 0), (1, 0), 2, CORAL),
     ])
+    append(t)
 
-t = Table([stream_cells], colWidths=[(PAGE_W - 1.8 * inch) / 4] * 4)
-t.setStyle(TableStyle([
-    ('BACKGROUND', (0, 0), (-1, -1), SURFACE_CARD),
-    ('BOX', (0, 0), (0, 0), 1, TEAL),
-    ('BOX', (1, 0), (1, 0), 1, TEAL),
-    ('BOX', (2, 0), (2, 0), 1, TEAL),
-    ('BOX', (3, 0), (3, 0), 1, TEAL),
-    ('TOPPADDING', (0, 0), (-1, -1), 8),
-    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ('LEFTPADDING', (0, 0), (-1, -1), 6),
-    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-]))
-story.append(t)
+    # Additional revenue streams
+    append(CachedParagraph('Additional Revenue Streams', rev_title_style))
+
+    # Title and body share one Paragraph, so each cell is parsed once
+    stream_cells = [
+        CachedParagraph(f'<font color="#{COLOR_HEX[CYAN]}" size="9"><b>{title}</b></font><br/><br/>{body}', stream_style)
+        for title, body in STREAMS
+    ]
+
+    t = Table([stream_cells], colWidths=FOUR_COL_WIDTHS)
+    t.setStyle(STREAMS_STYLE)
+    append(t)
+    return page
 
 
 # ============================================================
 # Build PDF
 # ============================================================
-doc.build(story, onFirstPage=page_bg, onLaterPages=page_bg)
-print(f'Generated: {output_path}')
-print(f'Size: {os.path.getsize(output_path):,} bytes')
+PAGES = (journey_page, roadmap_page, architecture_page, revenue_page)
+
+
+def generate(path=OUTPUT_PATH):
+    """Build the flowcharts PDF at ``path`` and return its size in bytes.
+
+    Styles, data tables and parsed paragraphs live at module scope, so
+    repeated calls in one process only assemble and lay out the story.
+    """
+    story = []
+    for build_page in PAGES:
+        story.extend(build_page())
+
+    # Build into a temp file beside ``path`` and move it into place only once
+    # the build succeeds, so a failed build leaves any existing PDF untouched
+    fd, tmp_path = tempfile.mkstemp(suffix='.pdf', dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            doc = SimpleDocTemplate(
+                f,
+                pagesize=landscape(A4),
+                topMargin=0.6*inch,
+                bottomMargin=0.5*inch,
+                leftMargin=0.6*inch,
+                rightMargin=0.6*inch,
+            )
+            doc.build(story, onFirstPage=page_bg, onLaterPages=page_bg)
+            size = f.tell()
+        # mkstemp creates the file 0600; keep the target's usual permissions
+        os.chmod(tmp_path, os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return size
+
+
+if __name__ == '__main__':
+    size = generate()
+    print(f'Generated: {OUTPUT_PATH}\nSize: {size:,} bytes')